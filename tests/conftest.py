@@ -6,6 +6,7 @@ import asyncio
 import inspect
 import logging
 import pathlib
+import functools
 from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
@@ -403,7 +404,8 @@ class BaseServerZNP(ZNP):
             return super().close()
 
 
-def load_nvram_json(name):
+@functools.lru_cache(maxsize=None)
+def _load_nvram_json(name):
     obj = json.loads((pathlib.Path(__file__).parent / "nvram" / name).read_text())
     nvram = {}
 
@@ -425,6 +427,11 @@ def load_nvram_json(name):
     return nvram
 
 
+def load_nvram_json(name):
+    # Every server mutates its NVRAM so each one gets a copy of the parsed file
+    return simple_deepcopy(_load_nvram_json(name))
+
+
 def reply_to(request):
     def inner(function):
         if not hasattr(function, "_reply_to"):
@@ -32,6 +32,10 @@ def test_command_header():
     assert new2.id == 0x00
     assert new2.cmd0 == 0x61
 
+    # Out of range values are not silently truncated by the bit fields
+    with pytest.raises(ValueError):
+        t.CommandHeader(0x12345, id=0x01)
+
 
 def test_command_setters():
     """Test setters"""
@@ -53,10 +57,17 @@ def test_command_setters():
 
                 assert len(set(perms)) == 1
                 assert perms[0].id == cmd_id
-                assert perms[0].subsystem == subsys
+                assert perms[0].subsystem is subsys
                 assert perms[0].type == cmd_type
 
 
+def test_subsystem_reserved():
+    reserved = t.Subsystem(0x0C)
+    assert reserved.name == "RESERVED_12"
+    assert reserved is t.Subsystem.RESERVED_12
+    assert t.CommandHeader(0x000C).subsystem is reserved
+
+
 def test_error_code():
     data = b"\x03"
     extra = b"the rest of the owl\x00\xff"
@@ -70,6 +81,12 @@ def test_error_code():
     assert rest == extra
     assert r.name == "undefined_0xaa"
 
+    # Unknown codes are cached
+    assert t.ErrorCode.deserialize(b"\xaa")[0] is r
+
+    # Non-integer values are still coerced by zigpy
+    assert t.ErrorCode(170.0).name == "undefined_0xaa"
+
 
 def _validate_schema(schema):
     for index, param in enumerate(schema):
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 import zigpy_znp.types as t
@@ -32,6 +35,10 @@ def test_general_frame_wrong_data():
     with pytest.raises(InvalidFrame):
         frames.GeneralFrame.deserialize(data)
 
+    # no data at all
+    with pytest.raises(InvalidFrame):
+        frames.GeneralFrame.deserialize(b"")
+
 
 def test_transport_frame():
     sof = t.uint8_t(0xFE).serialize()
@@ -59,3 +66,22 @@ def test_transport_frame():
 
     # constructor
     assert frames.TransportFrame(r.payload) == r
+
+
+def test_frame_copy_pickle():
+    frame = frames.TransportFrame(
+        frames.GeneralFrame(t.CommandHeader(0x0161), b"data goes in here")
+    )
+
+    for other in (
+        copy.copy(frame),
+        copy.deepcopy(frame),
+        pickle.loads(pickle.dumps(frame)),
+    ):
+        assert other == frame
+        assert other.payload == frame.payload
+        assert other.serialize() == frame.serialize()
+
+    assert copy.copy(frame.payload) == frame.payload
+    assert copy.deepcopy(frame.payload) == frame.payload
+    assert pickle.loads(pickle.dumps(frame.payload)) == frame.payload
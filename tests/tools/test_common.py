@@ -1,4 +1,13 @@
-from zigpy_znp.tools.common import UnclosableFile
+import sys
+
+import pytest
+
+import zigpy_znp.types as t
+from zigpy_znp.tools.common import (
+    UnclosableFile,
+    ClosableFileType,
+    channels_from_channel_mask,
+)
 
 
 def test_unclosable_file(tmp_path):
@@ -19,3 +28,34 @@ def test_unclosable_file(tmp_path):
     assert f.closed
 
     assert path.read_text() == "test"
+
+
+@pytest.mark.parametrize(
+    "mode, stream", [("wb", "stdout"), ("rb", "stdin"), ("w", "stdout"), ("r", "stdin")]
+)
+def test_closable_file_type_stdio(mode, stream):
+    f = ClosableFileType(mode)("-")
+
+    if "b" in mode:
+        assert f.f is getattr(sys, stream).buffer
+    else:
+        assert f.f is getattr(sys, stream)
+
+    f.close()
+    assert not f.closed
+
+
+@pytest.mark.parametrize(
+    "channels", [[], [11], [15, 20, 25], [26], list(range(11, 26 + 1))]
+)
+def test_channels_from_channel_mask(channels):
+    mask = t.Channels.from_channel_list(channels)
+
+    assert channels_from_channel_mask(mask) == tuple(channels)
+    assert list(channels_from_channel_mask(mask)) == list(mask)
+
+
+@pytest.mark.parametrize("bit", [0, 10, 27, 31])
+def test_channels_from_channel_mask_invalid(bit):
+    with pytest.raises(ValueError):
+        channels_from_channel_mask(t.Channels.ALL_CHANNELS | t.Channels(1 << bit))
@@ -1,4 +1,4 @@
-import json
+import copy
 import dataclasses
 
 import pytest
@@ -9,7 +9,7 @@ from zigpy.exceptions import NetworkNotFormed
 import zigpy_znp.types as t
 from zigpy_znp.znp import security
 from zigpy_znp.types.nvids import ExNvIds, OsalNvIds
-from zigpy_znp.tools.common import validate_backup_json
+from zigpy_znp.tools.common import json_dumps, json_loads, validate_backup_json
 from zigpy_znp.tools.network_backup import main as network_backup
 from zigpy_znp.tools.network_restore import main as network_restore
 
@@ -47,71 +47,99 @@ BARE_NODE_INFO = zigpy.state.NodeInfo(
     logical_type=None,
 )
 
+_EPID_BYTES = BARE_NETWORK_INFO.extended_pan_id.serialize()
+_NWKKEY_BLOB = b"\x01" + b"\xAB" * 16 + b"\x78\x56\x34\x12"
+_SEC_MAT_HDR1 = bytes.fromhex("01000000")
+_SEC_MAT_HDR2 = bytes.fromhex("02000000")
 
-@pytest.fixture
-def backup_json():
-    return {
-        "metadata": {
-            "format": "zigpy/open-coordinator-backup",
-            "internal": {
-                "creation_time": "2021-02-16T22:29:28+00:00",
-                "zstack": {"version": 3.3},
-            },
-            "source": "zigpy-znp@0.3.0",
-            "version": 1,
+_LEGACY = ExNvIds.LEGACY
+_NWKKEY = OsalNvIds.NWKKEY
+_SEC_TAB = OsalNvIds.LEGACY_NWK_SEC_MATERIAL_TABLE_START
+
+
+BACKUP_JSON = {
+    "metadata": {
+        "format": "zigpy/open-coordinator-backup",
+        "internal": {
+            "creation_time": "2021-02-16T22:29:28+00:00",
+            "zstack": {"version": 3.3},
         },
-        "stack_specific": {"zstack": {"tclk_seed": "c04884427c8a1ed7bb8412815ccce7aa"}},
-        "channel": 25,
-        "channel_mask": [15, 20, 25],
-        "pan_id": "feed",
-        "extended_pan_id": "abdefabcdefabcde",
-        "coordinator_ieee": "0123456780123456",
-        "nwk_update_id": 2,
-        "security_level": 5,
-        "network_key": {
-            "frame_counter": 66781,
-            "key": "37668fd64e35e03342e5ef9f35ccf4ab",
-            "sequence_number": 1,
+        "source": "zigpy-znp@0.3.0",
+        "version": 1,
+    },
+    "stack_specific": {"zstack": {"tclk_seed": "c04884427c8a1ed7bb8412815ccce7aa"}},
+    "channel": 25,
+    "channel_mask": [15, 20, 25],
+    "pan_id": "feed",
+    "extended_pan_id": "abdefabcdefabcde",
+    "coordinator_ieee": "0123456780123456",
+    "nwk_update_id": 2,
+    "security_level": 5,
+    "network_key": {
+        "frame_counter": 66781,
+        "key": "37668fd64e35e03342e5ef9f35ccf4ab",
+        "sequence_number": 1,
+    },
+    "devices": [
+        {
+            # No key
+            "ieee_address": "000b57fffe36b9a0",
+            "nwk_address": "f319",
+            "is_child": True,
         },
-        "devices": [
-            {
-                # No key
-                "ieee_address": "000b57fffe36b9a0",
-                "nwk_address": "f319",
-                "is_child": True,
-            },
-            {
-                "ieee_address": "000b57fffe38b212",
-                "link_key": {
-                    "key": "d2fabcbc83dd15d7a9362a7fa39becaa",  # Derived from seed
-                    "rx_counter": 123,
-                    "tx_counter": 456,
-                },
-                "nwk_address": "9672",
-                "is_child": True,
+        {
+            "ieee_address": "000b57fffe38b212",
+            "link_key": {
+                "key": "d2fabcbc83dd15d7a9362a7fa39becaa",  # Derived from seed
+                "rx_counter": 123,
+                "tx_counter": 456,
             },
-            {
-                "ieee_address": "aabbccddeeff0011",
-                "link_key": {
-                    "key": "4dcc18441d843fe86d8ae1396648a92b",  # Derived from seed
-                    "rx_counter": 112233,
-                    "tx_counter": 445566,
-                },
-                "nwk_address": "abcd",
-                "is_child": False,
+            "nwk_address": "9672",
+            "is_child": True,
+        },
+        {
+            "ieee_address": "aabbccddeeff0011",
+            "link_key": {
+                "key": "4dcc18441d843fe86d8ae1396648a92b",  # Derived from seed
+                "rx_counter": 112233,
+                "tx_counter": 445566,
             },
-            {
-                "ieee_address": "abcdabcabcabcaaa",
-                "link_key": {
-                    "key": "76567876567867876718736817112312",  # Not derived from seed
-                    "rx_counter": 511223,
-                    "tx_counter": 844556,
-                },
-                "nwk_address": None,  # No known NWK address
-                "is_child": True,  # but a child
+            "nwk_address": "abcd",
+            "is_child": False,
+        },
+        {
+            "ieee_address": "abcdabcabcabcaaa",
+            "link_key": {
+                "key": "76567876567867876718736817112312",  # Not derived from seed
+                "rx_counter": 511223,
+                "tx_counter": 844556,
             },
-        ],
-    }
+            "nwk_address": None,  # No known NWK address
+            "is_child": True,  # but a child
+        },
+    ],
+}
+
+# Z-Stack 1 does not preserve the TCLK seed or any link keys
+BACKUP_JSON_ZSTACK1 = copy.deepcopy(BACKUP_JSON)
+del BACKUP_JSON_ZSTACK1["stack_specific"]
+
+for _device in BACKUP_JSON_ZSTACK1["devices"]:
+    _device.pop("link_key", None)
+
+
+@pytest.fixture
+def backup_json():
+    return copy.deepcopy(BACKUP_JSON)
+
+
+@pytest.fixture(scope="module")
+def backup_file(tmp_path_factory):
+    # The backup is identical for every device so it is written only once
+    backup_file = tmp_path_factory.mktemp("backup") / "backup.json"
+    backup_file.write_bytes(json_dumps(BACKUP_JSON))
+
+    return backup_file
 
 
 def test_schema_validation(backup_json):
@@ -123,9 +151,12 @@ def test_schema_validation_counters(backup_json):
     validate_backup_json(backup_json)
     backup_json["devices"][1]["link_key"]["tx_counter"] = 0xFFFFFFFF + 1
 
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValidationError) as exc_info:
         validate_backup_json(backup_json)
 
+    assert list(exc_info.value.path) == ["devices", 1, "link_key", "tx_counter"]
+    assert exc_info.value.instance == 0xFFFFFFFF + 1
+
 
 def test_schema_validation_device_key_info(backup_json):
     validate_backup_json(backup_json)
@@ -150,7 +181,7 @@ async def test_network_backup_pipe(device, make_znp_server, capsys):
     await network_backup([znp_server._port_path, "-o", "-"])
     stdout, stderr = capsys.readouterr()
 
-    validate_backup_json(json.loads(stdout))
+    validate_backup_json(json_loads(stdout))
 
 
 @pytest.mark.parametrize("device", FORMED_DEVICES)
@@ -165,7 +196,10 @@ async def test_network_backup_formed(device, make_znp_server, tmp_path):
     backup_file = tmp_path / "backup.json"
     await network_backup([znp_server._port_path, "-o", str(backup_file)])
 
-    backup = json.loads(backup_file.read_text())
+    backup = json_loads(backup_file.read_bytes())
+
+    # The tool no longer validates its own output, so every device is checked here
+    validate_backup_json(backup)
 
     # XXX: actually test that the values match up with what the device NVRAM contains
     assert backup["metadata"]["version"] == 1
@@ -193,11 +227,8 @@ async def test_network_backup_formed(device, make_znp_server, tmp_path):
 
 @pytest.mark.parametrize("device", ALL_DEVICES)
 async def test_network_restore_and_backup(
-    device, make_znp_server, backup_json, tmp_path
+    device, make_znp_server, backup_file, tmp_path
 ):
-    backup_file = tmp_path / "backup.json"
-    backup_file.write_text(json.dumps(backup_json))
-
     znp_server = make_znp_server(server_cls=device)
 
     # Restore our backup on top of an existing network (or onto an empty device)
@@ -207,25 +238,17 @@ async def test_network_restore_and_backup(
     backup_file2 = tmp_path / "backup2.json"
     await network_backup([znp_server._port_path, "-o", str(backup_file2)])
 
-    backup_json2 = json.loads(backup_file2.read_text())
+    backup_json2 = json_loads(backup_file2.read_bytes())
 
     # Fix up some inconsequential metadata
-    backup_json2["metadata"]["internal"] = backup_json["metadata"]["internal"]
-    backup_json2["metadata"]["source"] = backup_json["metadata"]["source"]
+    backup_json2["metadata"]["internal"] = BACKUP_JSON["metadata"]["internal"]
+    backup_json2["metadata"]["source"] = BACKUP_JSON["metadata"]["source"]
     backup_json2["network_key"]["frame_counter"] -= 2500
 
-    # Remove things Z-Stack 1 does not preserve
     if issubclass(device, BaseZStack1CC2531):
-        del backup_json["stack_specific"]["zstack"]["tclk_seed"]
-
-        if not backup_json["stack_specific"]["zstack"]:
-            del backup_json["stack_specific"]
-
-        for device in backup_json["devices"]:
-            if "link_key" in device:
-                del device["link_key"]
-
-    assert backup_json == backup_json2
+        assert backup_json2 == BACKUP_JSON_ZSTACK1
+    else:
+        assert backup_json2 == BACKUP_JSON
 
 
 @pytest.mark.parametrize("device", [ResetLaunchpadCC26X2R1])
@@ -237,7 +260,7 @@ async def test_network_restore_pick_optimal_tclk(
     backup_json["stack_specific"]["zstack"]["tclk_seed"] = "ab" * 16
 
     backup_file = tmp_path / "backup.json"
-    backup_file.write_text(json.dumps(backup_json))
+    backup_file.write_bytes(json_dumps(backup_json))
 
     znp_server = make_znp_server(server_cls=device)
 
@@ -246,7 +269,7 @@ async def test_network_restore_pick_optimal_tclk(
     backup_file2 = tmp_path / "backup2.json"
     await network_backup([znp_server._port_path, "-o", str(backup_file2)])
 
-    backup_json2 = json.loads(backup_file2.read_text())
+    backup_json2 = json_loads(backup_file2.read_bytes())
 
     # Optimal TCLK is re-derived
     assert backup_json2["stack_specific"]["zstack"]["tclk_seed"] == old_tclk_seed
@@ -254,9 +277,7 @@ async def test_network_restore_pick_optimal_tclk(
 
 async def test_nwk_frame_counter_zstack1(make_connected_znp):
     znp, znp_server = await make_connected_znp(BaseZStack1CC2531)
-    znp_server._nvram[ExNvIds.LEGACY] = {
-        OsalNvIds.NWKKEY: b"\x01" + b"\xAB" * 16 + b"\x78\x56\x34\x12"
-    }
+    znp_server._nvram[_LEGACY] = {_NWKKEY: _NWKKEY_BLOB}
 
     assert (await security.read_nwk_frame_counter(znp)) == 0x12345678
 
@@ -268,19 +289,15 @@ async def test_nwk_frame_counter_zstack30(make_connected_znp):
     znp, znp_server = await make_connected_znp(BaseZStack3CC2531)
     znp.network_info = BARE_NETWORK_INFO
     znp.node_info = BARE_NODE_INFO
-    znp_server._nvram[ExNvIds.LEGACY] = {
+    znp_server._nvram[_LEGACY] = {
         # This value is ignored
-        OsalNvIds.NWKKEY: b"\x01" + b"\xAB" * 16 + b"\x78\x56\x34\x12",
+        _NWKKEY: _NWKKEY_BLOB,
         # Wrong EPID, ignored
-        OsalNvIds.LEGACY_NWK_SEC_MATERIAL_TABLE_START: bytes.fromhex(
-            "0f000000058eea0f004b1200"
-        ),
+        _SEC_TAB: bytes.fromhex("0f000000058eea0f004b1200"),
         # Exact EPID match, used
-        (OsalNvIds.LEGACY_NWK_SEC_MATERIAL_TABLE_START + 1): bytes.fromhex("01000000")
-        + BARE_NETWORK_INFO.extended_pan_id.serialize(),
+        (_SEC_TAB + 1): _SEC_MAT_HDR1 + _EPID_BYTES,
         # Generic EPID but ignored since EPID matches
-        (OsalNvIds.LEGACY_NWK_SEC_MATERIAL_TABLE_START + 2): bytes.fromhex("02000000")
-        + b"\xFF" * 8,
+        (_SEC_TAB + 2): _SEC_MAT_HDR2 + b"\xFF" * 8,
     }
 
     assert (await security.read_nwk_frame_counter(znp)) == 0x00000001
@@ -294,24 +311,24 @@ async def test_nwk_frame_counter_zstack30(make_connected_znp):
     await security.write_nwk_frame_counter(znp, 0xAABBCCDD)
     assert (await security.read_nwk_frame_counter(znp)) == 0xAABBCCDD
 
+    # The frame counter is written little endian at the start of the first entry
+    assert znp_server._nvram[_LEGACY][_SEC_TAB].startswith(b"\xDD\xCC\xBB\xAA")
+
 
 async def test_nwk_frame_counter_zstack33(make_connected_znp):
     znp, znp_server = await make_connected_znp(BaseLaunchpadCC26X2R1)
     znp.network_info = BARE_NETWORK_INFO
     znp.node_info = BARE_NODE_INFO
     znp_server._nvram = {
-        ExNvIds.LEGACY: {
+        _LEGACY: {
             # This value is ignored
-            OsalNvIds.NWKKEY: bytes.fromhex(
-                "00c927e9ce1544c9aa42340e4d5dc4c257e4010001000000"
-            )
+            _NWKKEY: bytes.fromhex("00c927e9ce1544c9aa42340e4d5dc4c257e4010001000000")
         },
         ExNvIds.NWK_SEC_MATERIAL_TABLE: {
             # Wrong EPID, ignored
             0x0000: bytes.fromhex("0100000037a7479777d7a224"),
             # Right EPID, used
-            0x0001: bytes.fromhex("02000000")
-            + BARE_NETWORK_INFO.extended_pan_id.serialize(),
+            0x0001: _SEC_MAT_HDR2 + _EPID_BYTES,
         },
     }
 
@@ -333,6 +350,9 @@ async def test_nwk_frame_counter_zstack33(make_connected_znp):
 
     await security.write_nwk_frame_counter(znp, 0x98765432)
     assert (await security.read_nwk_frame_counter(znp)) == 0x98765432
+    assert znp_server._nvram[ExNvIds.NWK_SEC_MATERIAL_TABLE][0x0000].startswith(
+        b"\x32\x54\x76\x98"
+    )
 
 
 def ieee_and_key(text) -> zigpy.state.Key:
@@ -450,7 +450,7 @@ class ZNP:
         if self.version == 1.2:
             # TCLK_SEED is TCLK_TABLE_START in Z-Stack 1
             nvram[OsalNvIds.TCLK_SEED] = t.TCLinkKey(
-                ExtAddr=t.EUI64.convert("FF:FF:FF:FF:FF:FF:FF:FF"),  # global
+                ExtAddr=const.BROADCAST_IEEE,  # global
                 Key=network_info.tc_link_key.key,
                 TxFrameCounter=0,
                 RxFrameCounter=0,
@@ -597,7 +597,7 @@ class ZNP:
                 fixed_entries = []
 
                 for entry in entries:
-                    if entry.extAddr != t.EUI64.convert("FF:FF:FF:FF:FF:FF:FF:FF"):
+                    if entry.extAddr != const.BROADCAST_IEEE:
                         fixed_entries.append(entry)
                     elif self.version == 3.30:
                         fixed_entries.append(const.EMPTY_ADDR_MGR_ENTRY_ZSTACK3)
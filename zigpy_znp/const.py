@@ -4,19 +4,23 @@ Z2M_PAN_ID = 0xA162
 Z2M_EXT_PAN_ID = t.EUI64.convert("DD:DD:DD:DD:DD:DD:DD:DD")
 Z2M_NETWORK_KEY = t.KeyData([1, 3, 5, 7, 9, 11, 13, 15, 0, 2, 4, 6, 8, 10, 12, 13])
 
+# Placeholder addresses used by empty or global NVRAM entries
+NULL_IEEE = t.EUI64.convert("00:00:00:00:00:00:00:00")
+BROADCAST_IEEE = t.EUI64.convert("FF:FF:FF:FF:FF:FF:FF:FF")
+
 DEFAULT_TC_LINK_KEY = t.KeyData(b"ZigBeeAlliance09")
 ZSTACK_CONFIGURE_SUCCESS = t.uint8_t(0x55)
 
 EMPTY_ADDR_MGR_ENTRY_ZSTACK1 = t.AddrMgrEntry(
     type=t.AddrMgrUserType.Default,
     nwkAddr=0xFFFF,
-    extAddr=t.EUI64.convert("FF:FF:FF:FF:FF:FF:FF:FF"),
+    extAddr=BROADCAST_IEEE,
 )
 
 EMPTY_ADDR_MGR_ENTRY_ZSTACK3 = t.AddrMgrEntry(
     type=t.AddrMgrUserType(0xFF),
     nwkAddr=0xFFFF,
-    extAddr=t.EUI64.convert("FF:FF:FF:FF:FF:FF:FF:FF"),
+    extAddr=BROADCAST_IEEE,
 )
 
 EMPTY_KEY = t.NwkKeyDesc(
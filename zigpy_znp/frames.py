@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import struct
 import functools
 import dataclasses
 
 import zigpy_znp.types as t
 from zigpy_znp.exceptions import InvalidFrame
 
+# The payload length and the command header, packed in a single call
+_FRAME_HEADER = struct.Struct("<BH")
+
 
 @dataclasses.dataclass(frozen=True)
 class GeneralFrame:
+    # Frames are created for every command sent and received, avoid a `__dict__`
+    __slots__ = ("header", "data")
+
     header: t.CommandHeader
     data: t.Bytes
 
@@ -25,6 +32,15 @@ class GeneralFrame:
                 f"Frame length cannot exceed 250 bytes. Got: {self.length}"
             )
 
+    def __getstate__(self) -> tuple[t.CommandHeader, t.Bytes]:
+        return self.header, self.data
+
+    def __setstate__(self, state: tuple[t.CommandHeader, t.Bytes]) -> None:
+        # Copying and unpickling restore slots with `setattr`, which we disallow
+        header, data = state
+        object.__setattr__(self, "header", header)
+        object.__setattr__(self, "data", data)
+
     @property
     def length(self) -> t.uint8_t:
         """Length of the frame."""
@@ -33,26 +49,32 @@ class GeneralFrame:
     @classmethod
     def deserialize(cls, data):
         """Deserialize frame and sanity checks."""
-        length, data = t.uint8_t.deserialize(data)
+        if not data:
+            raise InvalidFrame(f"Data is too short for {cls.__name__}")
+
+        length = data[0]
 
         if length > 250:
             raise InvalidFrame(f"Frame length cannot exceed 250 bytes. Got: {length}")
 
-        if len(data) < length + 2:
+        if len(data) < _FRAME_HEADER.size + length:
             raise InvalidFrame(f"Data is too short for {cls.__name__}")
 
-        header, data = t.CommandHeader.deserialize(data)
-        payload, data = data[:length], data[length:]
-        return cls(header, payload), data
+        _, header = _FRAME_HEADER.unpack_from(data)
+        end = _FRAME_HEADER.size + length
+
+        return cls(t.CommandHeader(header), data[_FRAME_HEADER.size : end]), data[end:]
 
     def serialize(self) -> bytes:
-        return self.length.serialize() + self.header.serialize() + self.data.serialize()
+        return _FRAME_HEADER.pack(len(self.data), self.header) + self.data
 
 
 @dataclasses.dataclass
 class TransportFrame:
     """Transport frame."""
 
+    __slots__ = ("payload",)
+
     SOF = t.uint8_t(0xFE)  # Start of frame marker
 
     payload: GeneralFrame
@@ -354,6 +354,9 @@ class NVRAMHelper:
         values,
         fill_value,
     ) -> None:
+        # The fill value is written to every remaining entry, serialize it only once
+        fill_value = self.serialize(fill_value)
+
         for sub_id, value in itertools.zip_longest(
             range(0x0000, 0xFFFF + 1), values, fillvalue=fill_value
         ):
@@ -374,6 +377,7 @@ class NVRAMHelper:
         self, start_nvid: t.uint16_t, end_nvid: t.uint16_t, values, *, fill_value
     ) -> None:
         values = list(values)
+        fill_value = self.serialize(fill_value)
 
         for nvid, value in itertools.zip_longest(
             range(start_nvid, end_nvid + 1), values, fillvalue=fill_value
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import sys
+import json
 import typing
 import logging
 import argparse
+import functools
 
 import jsonschema
 import coloredlogs
+import fastjsonschema
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    # orjson does not ship wheels for every interpreter (e.g. PyPy)
+    orjson = None
 
 import zigpy_znp.types as t
 import zigpy_znp.logger as log
@@ -112,8 +121,79 @@ OPEN_COORDINATOR_BACKUP_SCHEMA = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _backup_validator() -> typing.Callable[[t.JSONType], t.JSONType]:
+    # The schema is fixed so the specialized validator is compiled once, on first use
+    return fastjsonschema.compile(OPEN_COORDINATOR_BACKUP_SCHEMA)
+
+
 def validate_backup_json(backup: t.JSONType) -> None:
-    jsonschema.validate(backup, schema=OPEN_COORDINATOR_BACKUP_SCHEMA)
+    try:
+        _backup_validator()(backup)
+    except fastjsonschema.JsonSchemaValueException as e:
+        # The first path component is always the root name, `data`, and list indices
+        # are strings
+        path = []
+        obj = backup
+
+        for key in e.path[1:]:
+            if isinstance(obj, list):
+                key = int(key)
+
+            path.append(key)
+            obj = obj[key]
+
+        raise jsonschema.ValidationError(
+            f"{e.message}, got {e.value!r}",
+            validator=e.rule,
+            validator_value=e.rule_definition,
+            path=path,
+            instance=e.value,
+        ) from e
+
+
+def json_dumps(obj: t.JSONType) -> bytes:
+    """
+    Serializes an object into indented, newline-terminated UTF-8 JSON.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+    return (json.dumps(obj, indent=2) + "\n").encode("utf-8")  # pragma: no cover
+
+
+def json_loads(data: bytes) -> t.JSONType:
+    """
+    Deserializes UTF-8 JSON.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)  # pragma: no cover
+
+
+@functools.lru_cache(maxsize=64)
+def channels_from_channel_mask(mask: t.Channels) -> tuple[int, ...]:
+    """
+    Converts a channel mask into a tuple of channel numbers by iterating only over the
+    set bits, instead of testing every channel.
+    """
+
+    mask = int(mask)
+
+    if mask & ~int(t.Channels.ALL_CHANNELS) & 0xFFFFFFFF:
+        raise ValueError(f"Channel mask has unexpected members: 0x{mask:08X}")
+
+    channels = []
+
+    while mask:
+        lowest_bit = mask & -mask
+        channels.append(lowest_bit.bit_length() - 1)
+        mask ^= lowest_bit
+
+    return tuple(channels)
 
 
 class CustomArgumentParser(argparse.ArgumentParser):
@@ -175,6 +255,13 @@ class ClosableFileType(argparse.FileType):
     """
 
     def __call__(self, string):
+        # Python 3.8 returns text-mode stdin/stdout for `-` even in binary mode
+        if string == "-" and "b" in self._mode:
+            if "r" in self._mode:
+                return UnclosableFile(sys.stdin.buffer)
+
+            return UnclosableFile(sys.stdout.buffer)
+
         f = super().__call__(string)
 
         if f not in (sys.stdin, sys.stdout, sys.stdin.buffer, sys.stdout.buffer):
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import sys
-import json
 import asyncio
 import logging
 import datetime
@@ -11,7 +10,12 @@ import zigpy.state
 
 import zigpy_znp.types as t
 from zigpy_znp.api import ZNP
-from zigpy_znp.tools.common import ClosableFileType, setup_parser, validate_backup_json
+from zigpy_znp.tools.common import (
+    ClosableFileType,
+    json_dumps,
+    setup_parser,
+    channels_from_channel_mask,
+)
 from zigpy_znp.zigbee.application import ControllerApplication
 
 LOGGER = logging.getLogger(__name__)
@@ -64,7 +68,7 @@ def zigpy_state_to_json_backup(
         "nwk_update_id": network_info.nwk_update_id,
         "security_level": network_info.security_level,
         "channel": network_info.channel,
-        "channel_mask": list(network_info.channel_mask),
+        "channel_mask": list(channels_from_channel_mask(network_info.channel_mask)),
         "network_key": {
             "key": network_info.network_key.key.serialize().hex(),
             "sequence_number": network_info.network_key.seq,
@@ -95,16 +99,13 @@ async def backup_network(znp: ZNP) -> t.JSONType:
     if znp.network_info.stack_specific:
         obj["stack_specific"] = znp.network_info.stack_specific
 
-    # Ensure our generated backup is valid
-    validate_backup_json(obj)
-
     return obj
 
 
 async def main(argv: list[str]) -> None:
     parser = setup_parser("Backup adapter network settings")
     parser.add_argument(
-        "--output", "-o", type=ClosableFileType("w"), help="Output file", default="-"
+        "--output", "-o", type=ClosableFileType("wb"), help="Output file", default="-"
     )
     args = parser.parse_args(argv)
 
@@ -115,7 +116,7 @@ async def main(argv: list[str]) -> None:
         backup_obj = await backup_network(znp)
         znp.close()
 
-        f.write(json.dumps(backup_obj, indent=4))
+        f.write(json_dumps(backup_obj))
 
 
 if __name__ == "__main__":
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import sys
-import json
 import asyncio
 
 import zigpy.state
@@ -10,7 +9,12 @@ import zigpy.zdo.types as zdo_t
 import zigpy_znp.const as const
 import zigpy_znp.types as t
 from zigpy_znp.api import ZNP
-from zigpy_znp.tools.common import ClosableFileType, setup_parser, validate_backup_json
+from zigpy_znp.tools.common import (
+    ClosableFileType,
+    json_loads,
+    setup_parser,
+    validate_backup_json,
+)
 from zigpy_znp.zigbee.application import ControllerApplication
 
 
@@ -106,7 +110,7 @@ async def restore_network(
 async def main(argv: list[str]) -> None:
     parser = setup_parser("Restore adapter network settings")
     parser.add_argument(
-        "--input", "-i", type=ClosableFileType("r"), help="Input file", required=True
+        "--input", "-i", type=ClosableFileType("rb"), help="Input file", required=True
     )
     parser.add_argument(
         "--counter-increment",
@@ -118,7 +122,7 @@ async def main(argv: list[str]) -> None:
     args = parser.parse_args(argv)
 
     with args.input as f:
-        backup = json.load(f)
+        backup = json_loads(f.read())
 
     validate_backup_json(backup)
 
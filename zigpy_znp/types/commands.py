@@ -26,6 +26,10 @@ class CommandType(t.enum8):
     RESERVED_7 = 7
 
 
+# Pseudo-members for error codes without a definition, indexed by value
+_UNKNOWN_ERROR_CODES: list[ErrorCode | None] = [None] * 256
+
+
 class ErrorCode(t.enum8):
     """Error code."""
 
@@ -34,6 +38,20 @@ class ErrorCode(t.enum8):
     INVALID_PARAMETER = 0x03
     INVALID_LENGTH = 0x04
 
+    @classmethod
+    def _missing_(cls, value):
+        # Unknown codes are memoized instead of creating a new pseudo-member each time.
+        # Anything that is not a plain byte value is left to zigpy to coerce or reject.
+        if not isinstance(value, int) or not 0x00 <= value <= 0xFF:
+            return super()._missing_(value)
+
+        member = _UNKNOWN_ERROR_CODES[value]
+
+        if member is None:
+            member = _UNKNOWN_ERROR_CODES[value] = super()._missing_(value)
+
+        return member
+
 
 class Subsystem(t.enum8):
     """Command subsystem."""
@@ -89,24 +107,36 @@ class CallbackSubsystem(t.enum16):
     ALL = 0xFFFF
 
 
+# Enum construction is slow, these are accessed for every frame
+_SUBSYSTEM_BY_VALUE = {m.value: m for m in Subsystem}
+_COMMAND_TYPE_BY_VALUE = {m.value: m for m in CommandType}
+
+
 class CommandHeader(t.uint16_t):
     """CommandHeader class."""
 
     def __new__(
         cls, value: int = 0x0000, *, id=None, subsystem=None, type=None
     ) -> CommandHeader:
+        # Validate the value before any of the bit fields can mask it
         instance = super().__new__(cls, value)
 
+        if id is None and subsystem is None and type is None:
+            return instance
+
+        # Apply the bit fields to a plain integer to construct only one more header
+        value = int(instance)
+
         if id is not None:
-            instance = instance.with_id(id)
+            value = value & 0x00FF | (id & 0xFF) << 8
 
         if subsystem is not None:
-            instance = instance.with_subsystem(subsystem)
+            value = value & 0xFFE0 | subsystem & 0x1F
 
         if type is not None:
-            instance = instance.with_type(type)
+            value = value & 0xFF1F | (type & 0x07) << 5
 
-        return instance
+        return super().__new__(cls, value)
 
     @property
     def cmd0(self) -> t.uint8_t:
@@ -124,7 +154,7 @@ class CommandHeader(t.uint16_t):
     @property
     def subsystem(self) -> Subsystem:
         """Return subsystem of the command."""
-        return Subsystem(self.cmd0 & 0x1F)
+        return _SUBSYSTEM_BY_VALUE[self & 0x1F]
 
     def with_subsystem(self, value: Subsystem) -> CommandHeader:
         return type(self)(self & 0xFFE0 | value & 0x1F)
@@ -132,7 +162,7 @@ class CommandHeader(t.uint16_t):
     @property
     def type(self) -> CommandType:
         """Return command type."""
-        return CommandType(self.cmd0 >> 5)
+        return _COMMAND_TYPE_BY_VALUE[(self & 0xFF) >> 5]
 
     def with_type(self, value) -> CommandHeader:
         return type(self)(self & 0xFF1F | (value & 0x07) << 5)
@@ -187,11 +217,10 @@ class CommandsMeta(type):
                 "Callback": None,
             }
 
-            header = (
-                CommandHeader()
-                .with_id(definition.command_id)
-                .with_type(definition.command_type)
-                .with_subsystem(subsystem)
+            header = CommandHeader(
+                id=definition.command_id,
+                type=definition.command_type,
+                subsystem=subsystem,
             )
 
             rsp_header = header
@@ -101,7 +101,7 @@ async def read_nwk_frame_counter(znp: ZNP, *, ext_pan_id: t.EUI64 = None) -> t.u
         if entry.ExtendedPanID == ext_pan_id:
             # Always prefer the entry for our current network
             return entry.FrameCounter
-        elif entry.ExtendedPanID == t.EUI64.convert("FF:FF:FF:FF:FF:FF:FF:FF"):
+        elif entry.ExtendedPanID == const.BROADCAST_IEEE:
             # But keep track of the global entry if it already exists
             global_entry = entry
 
@@ -134,7 +134,7 @@ async def write_nwk_frame_counter(
 
     fill_entry = t.NwkSecMaterialDesc(
         FrameCounter=0x00000000,
-        ExtendedPanID=t.EUI64.convert("00:00:00:00:00:00:00:00"),
+        ExtendedPanID=const.NULL_IEEE,
     )
 
     # The security material tables are quite small (4 values) so it's simpler to just
@@ -189,7 +189,7 @@ async def read_hashed_link_keys(  # type:ignore[misc]
         )
 
     async for entry in entries:
-        if entry.extAddr == t.EUI64.convert("00:00:00:00:00:00:00:00"):
+        if entry.extAddr == const.NULL_IEEE:
             continue
 
         # XXX: why do both of these types appear?
@@ -262,8 +262,8 @@ async def read_devices(
 
     for entry in addr_mgr:
         if entry.extAddr in (
-            t.EUI64.convert("00:00:00:00:00:00:00:00"),
-            t.EUI64.convert("FF:FF:FF:FF:FF:FF:FF:FF"),
+            const.NULL_IEEE,
+            const.BROADCAST_IEEE,
         ):
             continue
         elif entry.type == t.AddrMgrUserType.Default:
@@ -465,7 +465,7 @@ async def write_devices(
     tclk_fill_value = t.TCLKDevEntry(
         txFrmCntr=0,
         rxFrmCntr=0,
-        extAddr=t.EUI64.convert("00:00:00:00:00:00:00:00"),
+        extAddr=const.NULL_IEEE,
         keyAttributes=t.KeyAttributes.DEFAULT_KEY,
         keyType=t.KeyType.NONE,
         SeedShift_IcIndex=0,